@@ -9,7 +9,10 @@ module.exports = {
       watch: false,
       max_memory_restart: '800M',
       env: {
-        NODE_ENV: 'production'
+        NODE_ENV: 'production',
+        // sqlite3 ينفذ استعلاماته على libuv threadpool
+        // الافتراضي 4 خيوط مشتركة مع fs/dns
+        UV_THREADPOOL_SIZE: 8
       }
     }
   ]
@@ -23,3 +23,26 @@ export const SECURITY = {
   MAX_RETRIES: 5,
   SESSION_INACTIVITY_DAYS: 14,
 };
+
+// قيم الحالة المخزنة كنصوص بسيطة في SQLite
+// (بدون CHECK أو تحويل لكل صف)
+export const JOIN_STATUS = {
+  JOINED: 'joined',
+  REQUESTED: 'requested',
+  PENDING: 'pending',
+  FAILED: 'failed',
+  INVALID: 'invalid',
+  UNKNOWN: 'unknown',
+};
+
+export const AD_TYPES = {
+  TEXT: 'text',
+  IMAGE: 'image',
+  VIDEO: 'video',
+  CONTACT: 'contact',
+};
+
+export const REPLY_SCOPES = {
+  PRIVATE: 'private',
+  GROUP: 'group',
+};
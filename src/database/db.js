@@ -1,3 +1,4 @@
+import crypto from 'crypto';
 import fs from 'fs';
 import path from 'path';
 import sqlite3 from 'sqlite3';
@@ -10,16 +11,9 @@ import { logger } from '../logger/logger.js';
 // ================================
 const DB_FILE = PATHS.DATABASE_FILE;
 
-// ================================
-// Ensure Database File Exists
-// ================================
-if (!fs.existsSync(DB_FILE)) {
-  fs.writeFileSync(DB_FILE, '');
-  logger.info('Database file created');
-}
-
 // ================================
 // Open Database Connection
+// (sqlite3 ينشئ الملف بنفسه إن لم يوجد)
 // ================================
 export const db = new sqlite3.Database(DB_FILE, (err) => {
   if (err) {
@@ -29,10 +23,28 @@ export const db = new sqlite3.Database(DB_FILE, (err) => {
   logger.info('Database connected');
 });
 
+// ================================
+// Connection Tuning
+// ================================
+// إعدادات على مستوى الاتصال (تضيع عند إعادة الفتح)
+// WAL: قراءة متزامنة مع الكتابة
+// busy_timeout: انتظار بدل فشل SQLITE_BUSY
+db.serialize(() => {
+  db.run('PRAGMA foreign_keys = ON');
+  db.run('PRAGMA journal_mode = WAL');
+  db.run('PRAGMA synchronous = NORMAL');
+  db.run('PRAGMA busy_timeout = 5000');
+});
+
 // ================================
 // Initialize Schema
 // ================================
-export function initDatabase() {
+// يتم قراءة schema.sql مرة واحدة فقط
+let cachedSchema = null;
+
+function loadSchema() {
+  if (cachedSchema !== null) return cachedSchema;
+
   const schemaPath = path.join(PATHS.SRC, 'database', 'schema.sql');
 
   if (!fs.existsSync(schemaPath)) {
@@ -40,13 +52,39 @@ export function initDatabase() {
     process.exit(1);
   }
 
-  const schema = fs.readFileSync(schemaPath, 'utf8');
+  cachedSchema = fs.readFileSync(schemaPath, 'utf8');
+  return cachedSchema;
+}
 
-  db.exec(schema, (err) => {
-    if (err) {
-      logger.error(`Schema initialization failed: ${err.message}`);
-      process.exit(1);
+// ختم schema داخل القاعدة نفسها (PRAGMA user_version)
+// ملف ختم خارجي كان يبقى بعد حذف القاعدة
+// فيُتخطى التنفيذ على ملف جديد فارغ
+// 0 = قاعدة جديدة لم يُطبق عليها شيء بعد
+function schemaStamp(schema) {
+  const hash = crypto.createHash('sha256').update(schema).digest('hex');
+  return parseInt(hash.slice(0, 8), 16) & 0x7fffffff;
+}
+
+export function initDatabase() {
+  const schema = loadSchema();
+  const stamp = schemaStamp(schema);
+
+  db.get('PRAGMA user_version', (err, row) => {
+    if (!err && row && row.user_version === stamp) {
+      logger.info('Database schema up to date (skipped)');
+      return;
     }
-    logger.info('Database schema initialized');
+
+    db.exec(schema, (execErr) => {
+      if (execErr) {
+        logger.error(`Schema initialization failed: ${execErr.message}`);
+        process.exit(1);
+      }
+
+      // PRAGMA لا يقبل باراميترات — القيمة رقم محسوب محليًا
+      db.run(`PRAGMA user_version = ${stamp}`);
+
+      logger.info('Database schema initialized');
+    });
   });
 }
@@ -27,7 +27,9 @@ export async function create({ name, is_active = 0 }) {
 export async function getAll() {
   return new Promise((resolve, reject) => {
     db.all(
-      `SELECT * FROM accounts ORDER BY created_at DESC`,
+      // الترتيب عبر المفتاح الأساسي (نفس ترتيب الإنشاء)
+      // بدون خطوة فرز على عمود غير مفهرس
+      `SELECT * FROM accounts ORDER BY id DESC`,
       [],
       (err, rows) => {
         if (err) return reject(err);
@@ -1,5 +1,9 @@
 import { db } from '../db.js';
 
+// كاش القواعد حسب النطاق — تُقرأ مع كل رسالة واردة
+// لكنها لا تتغير إلا عند الإضافة
+const cache = new Map(); // scope → rows
+
 export const AutoRepliesRepo = {
   create(scope, keyword, replyText) {
     return new Promise((resolve, reject) => {
@@ -9,6 +13,7 @@ export const AutoRepliesRepo = {
         [scope, keyword, replyText],
         function (err) {
           if (err) return reject(err);
+          cache.delete(scope);
           resolve(this.lastID);
         }
       );
@@ -16,11 +21,19 @@ export const AutoRepliesRepo = {
   },
 
   getAll(scope) {
+    if (cache.has(scope)) {
+      return Promise.resolve(cache.get(scope));
+    }
+
     return new Promise((resolve, reject) => {
       db.all(
         `SELECT * FROM auto_replies WHERE scope = ?`,
         [scope],
-        (err, rows) => (err ? reject(err) : resolve(rows))
+        (err, rows) => {
+          if (err) return reject(err);
+          cache.set(scope, rows);
+          resolve(rows);
+        }
       );
     });
   }
@@ -1,24 +1,43 @@
 import { db } from '../db.js';
+import { JOIN_STATUS } from '../../config/constants.js';
+
+// كاش قصير العمر لقائمة المجموعات
+// تتغير فقط عند انضمام جديد → إبطال عند add
+const CACHE_TTL_MS = 60000;
+const cache = new Map(); // accountId → { at, rows }
 
 export const GroupsRepo = {
-  add(accountId, groupName, groupJid, status = 'joined') {
+  add(accountId, groupName, groupJid, status = JOIN_STATUS.JOINED) {
     return new Promise((resolve, reject) => {
       db.run(
         `INSERT OR IGNORE INTO groups
          (account_id, group_name, group_jid, join_status, joined_at)
          VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)`,
         [accountId, groupName, groupJid, status],
-        (err) => (err ? reject(err) : resolve())
+        (err) => {
+          if (err) return reject(err);
+          cache.delete(accountId);
+          resolve();
+        }
       );
     });
   },
 
   getAll(accountId) {
+    const cached = cache.get(accountId);
+    if (cached && Date.now() - cached.at < CACHE_TTL_MS) {
+      return Promise.resolve(cached.rows);
+    }
+
     return new Promise((resolve, reject) => {
       db.all(
         `SELECT * FROM groups WHERE account_id = ?`,
         [accountId],
-        (err, rows) => (err ? reject(err) : resolve(rows))
+        (err, rows) => {
+          if (err) return reject(err);
+          cache.set(accountId, { at: Date.now(), rows });
+          resolve(rows);
+        }
       );
     });
   }
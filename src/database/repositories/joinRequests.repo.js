@@ -0,0 +1,75 @@
+import { db } from '../db.js';
+
+export const JoinRequestsRepo = {
+  add(groupLink, status) {
+    return new Promise((resolve, reject) => {
+      db.run(
+        `INSERT INTO join_requests (group_link, status)
+         VALUES (?, ?)`,
+        [groupLink, status],
+        function (err) {
+          if (err) return reject(err);
+          resolve(this.lastID);
+        }
+      );
+    });
+  },
+
+  // تسجيل دفعة نتائج انضمام في معاملة واحدة
+  addMany(rows = []) {
+    if (!rows.length) return Promise.resolve(0);
+
+    return new Promise((resolve, reject) => {
+      db.serialize(() => {
+        // المعاملة كلها تُصفّ بشكل متزامن كوحدة واحدة
+        // (نفس معالجة LinksRepo.addMany للتداخل)
+        let firstErr = null;
+        const trap = (err) => {
+          if (err && !firstErr) firstErr = err;
+        };
+
+        db.run('BEGIN', trap);
+
+        const stmt = db.prepare(
+          `INSERT INTO join_requests (group_link, status)
+           VALUES (?, ?)`
+        );
+
+        for (const row of rows) {
+          stmt.run([row.link, row.status], trap);
+        }
+
+        stmt.finalize(trap);
+
+        db.run('COMMIT', (commitErr) => {
+          const err = firstErr || commitErr;
+          if (err) {
+            db.run('ROLLBACK', () => {});
+            return reject(err);
+          }
+          resolve(rows.length);
+        });
+      });
+    });
+  },
+
+  getPending() {
+    return new Promise((resolve, reject) => {
+      db.all(
+        `SELECT * FROM join_requests WHERE status = 'pending'`,
+        [],
+        (err, rows) => (err ? reject(err) : resolve(rows || []))
+      );
+    });
+  },
+
+  updateStatus(id, status) {
+    return new Promise((resolve, reject) => {
+      db.run(
+        `UPDATE join_requests SET status = ? WHERE id = ?`,
+        [status, id],
+        (err) => (err ? reject(err) : resolve())
+      );
+    });
+  },
+};
@@ -13,6 +13,51 @@ export const LinksRepo = {
     });
   },
 
+  // إدخال دفعة روابط في معاملة واحدة
+  // (بدل رحلة منفصلة لكل رابط)
+  addMany(rows = []) {
+    if (!rows.length) return Promise.resolve(0);
+
+    return new Promise((resolve, reject) => {
+      db.serialize(() => {
+        // المعاملة كلها تُصفّ هنا بشكل متزامن كوحدة واحدة
+        // COMMIT مؤجل من callback كان يترك نافذة يتسلل إليها
+        // BEGIN من دفعة متوازية (معاملة داخل معاملة)
+        let firstErr = null;
+        const trap = (err) => {
+          if (err && !firstErr) firstErr = err;
+        };
+
+        db.run('BEGIN', trap);
+
+        const stmt = db.prepare(
+          `INSERT OR IGNORE INTO links
+           (account_id, group_jid, url, type, hash)
+           VALUES (?, ?, ?, ?, ?)`
+        );
+
+        for (const row of rows) {
+          stmt.run(
+            [row.accountId, row.groupJid, row.url, row.type, row.hash],
+            trap
+          );
+        }
+
+        stmt.finalize(trap);
+
+        db.run('COMMIT', (commitErr) => {
+          const err = firstErr || commitErr;
+          if (err) {
+            // callback فارغ حتى لا يصعد فشل ROLLBACK كحدث error
+            db.run('ROLLBACK', () => {});
+            return reject(err);
+          }
+          resolve(rows.length);
+        });
+      });
+    });
+  },
+
   getAllTypes() {
     return new Promise((resolve, reject) => {
       db.all(
@@ -34,6 +79,36 @@ export const LinksRepo = {
     });
   },
 
+  // قراءة تدفقية صف بصف (للتصدير الكبير)
+  // بدون تحميل كل النتائج في الذاكرة
+  eachByType(type, onRow) {
+    return new Promise((resolve, reject) => {
+      db.each(
+        `SELECT url FROM links WHERE type = ? ORDER BY id ASC`,
+        [type],
+        (err, row) => {
+          if (!err) onRow(row);
+        },
+        (err, rowCount) => (err ? reject(err) : resolve(rowCount))
+      );
+    });
+  },
+
+  // عدد الروابط لكل نوع في استعلام واحد
+  // (يستفيد من فهرس type)
+  countByType() {
+    return new Promise((resolve, reject) => {
+      db.all(
+        `SELECT type, COUNT(*) as total
+         FROM links
+         GROUP BY type
+         ORDER BY total DESC`,
+        [],
+        (err, rows) => (err ? reject(err) : resolve(rows || []))
+      );
+    });
+  },
+
   count() {
     return new Promise((resolve, reject) => {
       db.get(
@@ -1,5 +1,9 @@
 import { db } from '../db.js';
 
+// كاش داخل الذاكرة يكتب ويقرأ مع القاعدة
+// حتى لا تتكرر SELECT لنفس المفتاح بعد كل كتابة
+const cache = new Map();
+
 export const SettingsRepo = {
   set(key, value) {
     return new Promise((resolve, reject) => {
@@ -7,17 +11,29 @@ export const SettingsRepo = {
         `INSERT OR REPLACE INTO settings (key, value)
          VALUES (?, ?)`,
         [key, value],
-        (err) => (err ? reject(err) : resolve())
+        (err) => {
+          if (err) return reject(err);
+          cache.set(key, value);
+          resolve();
+        }
       );
     });
   },
 
   get(key) {
+    if (cache.has(key)) {
+      return Promise.resolve(cache.get(key));
+    }
+
     return new Promise((resolve, reject) => {
       db.get(
         `SELECT value FROM settings WHERE key = ?`,
         [key],
-        (err, row) => (err ? reject(err) : resolve(row?.value))
+        (err, row) => {
+          if (err) return reject(err);
+          cache.set(key, row?.value);
+          resolve(row?.value);
+        }
       );
     });
   },
@@ -27,7 +43,13 @@ export const SettingsRepo = {
       db.all(
         `SELECT key, value FROM settings`,
         [],
-        (err, rows) => (err ? reject(err) : resolve(rows))
+        (err, rows) => {
+          if (err) return reject(err);
+          for (const row of rows) {
+            cache.set(row.key, row.value);
+          }
+          resolve(rows);
+        }
       );
     });
   }
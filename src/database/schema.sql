@@ -68,6 +68,19 @@ CREATE TABLE IF NOT EXISTS ads (
   created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- =========================
+-- Hot-Path Indexes
+-- =========================
+-- فهرس جزئي: الطلبات المعلقة فقط
+-- (أغلب الصفوف تصبح غير معلقة مع الوقت)
+CREATE INDEX IF NOT EXISTS idx_join_requests_pending
+  ON join_requests (requested_at)
+  WHERE status = 'pending';
+
+-- فهرس تغطية لقراءة الروابط حسب النوع
+CREATE INDEX IF NOT EXISTS idx_links_type_id
+  ON links (type, id);
+
 -- =========================
 -- Auto Replies Rules
 -- =========================
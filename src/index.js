@@ -12,7 +12,7 @@ import { PATHS } from './config/paths.js';
 import { logger } from './logger/logger.js';
 
 // Database
-import { initDatabase } from './database/db.js';
+import { db, initDatabase } from './database/db.js';
 
 // ================================
 // Telegram (CRITICAL ORDER)
@@ -21,7 +21,7 @@ import './telegram/bot.js';     // ⬅️ لازم أولاً
 import './telegram/router.js';  // ⬅️ بعدها
 
 // WhatsApp (controller side-effects only)
-import './whatsapp/whatsapp.controller.js';
+import { shutdownWhatsApp } from './whatsapp/whatsapp.controller.js';
 
 // ================================
 // Ensure Required Directories
@@ -46,9 +46,23 @@ function ensureDirectories() {
 // ================================
 // Graceful Shutdown
 // ================================
-function handleShutdown(signal) {
+let shuttingDown = false;
+
+async function handleShutdown(signal) {
+  // إشارة ثانية أثناء الإغلاق = تجاهل
+  if (shuttingDown) return;
+  shuttingDown = true;
+
   logger.warn(`Received ${signal}. Shutting down gracefully...`);
-  process.exit(0);
+
+  // مهلة قصوى حتى لا يعلق الإغلاق
+  setTimeout(() => process.exit(0), 10000).unref();
+
+  try {
+    await shutdownWhatsApp();
+  } catch (_) {}
+
+  db.close(() => process.exit(0));
 }
 
 process.on('SIGINT', handleShutdown);
@@ -15,18 +15,50 @@ if (!fs.existsSync(PATHS.LOGS)) {
 // ================================
 // Log Format
 // ================================
+// جدول مستويات جاهز بدل toUpperCase لكل سطر
+const LEVEL_LABELS = {
+  error: 'ERROR',
+  warn: 'WARN',
+  info: 'INFO',
+  http: 'HTTP',
+  verbose: 'VERBOSE',
+  debug: 'DEBUG',
+  silly: 'SILLY',
+};
+
 const logFormat = winston.format.printf(
   ({ timestamp, level, message }) =>
-    `[${timestamp}] [${level.toUpperCase()}] ${message}`
+    `[${timestamp}] [${LEVEL_LABELS[level] || level.toUpperCase()}] ${message}`
 );
 
+// الطابع الزمني بدقة ثانية → يُبنى مرة لكل ثانية
+// بدل تنسيق كامل لكل سطر سجل
+const pad = (n) => String(n).padStart(2, '0');
+
+let stampSecond = 0;
+let stampValue = '';
+
+function cachedTimestamp() {
+  const second = Math.floor(Date.now() / 1000);
+
+  if (second !== stampSecond) {
+    stampSecond = second;
+    const d = new Date(second * 1000);
+    stampValue =
+      `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())} ` +
+      `${pad(d.getHours())}:${pad(d.getMinutes())}:${pad(d.getSeconds())}`;
+  }
+
+  return stampValue;
+}
+
 // ================================
 // Winston Logger
 // ================================
 export const logger = winston.createLogger({
   level: ENV.LOG_LEVEL,
   format: winston.format.combine(
-    winston.format.timestamp({ format: 'YYYY-MM-DD HH:mm:ss' }),
+    winston.format.timestamp({ format: cachedTimestamp }),
     logFormat
   ),
   transports: [
@@ -5,13 +5,19 @@
 // لا يتم فيه تخزين أي بيانات دائمة
 // يتم تصفيره عند إعادة التشغيل
 
+import { BoundedSet } from '../utils/bounded.set.js';
+
 export const RuntimeState = {
   // Auto Posting
   autoPosting: false,
 
+  // لإلغاء انتظارات النشر فور الإيقاف
+  autoPostingAbort: null,
+
   // Auto Replies
   autoReply: false,
 
   // منع تكرار الرد في الخاص
-  repliedUsers: new Set(),
+  // سعة محدودة حتى لا تنمو الذاكرة بلا حدود
+  repliedUsers: new BoundedSet(5000),
 };
@@ -8,6 +8,11 @@ import { logger } from '../logger/logger.js';
 // =====================================
 export const bot = new TelegramBot(ENV.TELEGRAM.TOKEN, {
   polling: true,
+  request: {
+    // اتصال HTTPS دائم (keep-alive)
+    // بدل مصافحة TLS جديدة لكل نداء API
+    forever: true,
+  },
 });
 
 // =====================================
@@ -34,10 +39,32 @@ bot.on('webhook_error', (err) => {
 // =====================================
 // نمنع فقط الأوامر النصية من غير الأدمن
 // ولا نلمس callback_query نهائيًا
+
+// تجميع التحذيرات المكررة: رد واحد لكل مستخدم
+// داخل النافذة بدل رسالة لكل أمر
+const UNAUTHORIZED_WINDOW_MS = 60000;
+const lastWarned = new Map(); // userId → timestamp
+
 bot.on('message', (msg) => {
   if (!isAdmin(msg)) {
     // نرد فقط لو رسالة نصية (أوامر)
     if (msg.text && msg.text.startsWith('/')) {
+      const now = Date.now();
+      const last = lastWarned.get(msg.from.id) || 0;
+
+      if (now - last < UNAUTHORIZED_WINDOW_MS) return;
+
+      // تنظيف الخريطة عند التضخم
+      if (lastWarned.size >= 1000) {
+        for (const [id, at] of lastWarned) {
+          if (now - at >= UNAUTHORIZED_WINDOW_MS) {
+            lastWarned.delete(id);
+          }
+        }
+      }
+
+      lastWarned.set(msg.from.id, now);
+
       try {
         bot.sendMessage(
           msg.chat.id,
@@ -60,10 +60,15 @@ export async function list(chatId) {
     return;
   }
 
-  let text = '📱 الحسابات المرتبطة:\n\n';
-  for (const acc of accounts) {
-    text += `• ${acc.name} (${acc.is_active ? 'نشط' : 'غير نشط'})\n`;
-  }
+  // بناء النص بـ join واحد
+  // بدل إعادة إنشاء النص مع كل سطر
+  const text = [
+    '📱 الحسابات المرتبطة:',
+    '',
+    ...accounts.map(
+      (acc) => `• ${acc.name} (${acc.is_active ? 'نشط' : 'غير نشط'})`
+    ),
+  ].join('\n');
 
   await bot.sendMessage(chatId, text, {
     reply_markup: accountListKeyboard(accounts),
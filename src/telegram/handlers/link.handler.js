@@ -2,7 +2,7 @@ import fs from 'fs';
 import { bot } from '../bot.js';
 import { SettingsRepo } from '../../database/repositories/settings.repo.js';
 import { LinksRepo } from '../../database/repositories/links.repo.js';
-import { exportTxt } from '../../utils/file.exporter.js';
+import { createTxtExport } from '../../utils/file.exporter.js';
 
 export async function start(chatId) {
   await SettingsRepo.set('links_collecting', '1');
@@ -15,15 +15,17 @@ export async function stop(chatId) {
 }
 
 export async function show(chatId) {
-  const types = await LinksRepo.getAllTypes();
+  const stats = await LinksRepo.countByType();
 
-  if (!types.length) {
+  if (!stats.length) {
     return bot.sendMessage(chatId, '❌ لا توجد روابط مخزنة');
   }
 
+  const lines = stats.map((row) => `${row.type}: ${row.total}`);
+
   bot.sendMessage(
     chatId,
-    `📂 أقسام الروابط:\n\n${types.join('\n')}`
+    `📂 أقسام الروابط:\n\n${lines.join('\n')}`
   );
 }
 
@@ -34,19 +36,37 @@ export async function exportLinks(chatId) {
     return bot.sendMessage(chatId, '❌ لا توجد روابط للتصدير');
   }
 
-  for (const type of types) {
-    const rows = await LinksRepo.getByType(type);
-    if (!rows.length) continue;
+  // إقرار فوري ثم التجهيز والإرسال في الخلفية
+  // حتى لا يعلق المستدعي على تصدير كبير
+  await bot.sendMessage(chatId, '⏳ جارٍ تجهيز ملفات التصدير...');
 
-    const filePath = exportTxt(
-      `${type}.txt`,
-      rows.map(r => r.url)
-    );
+  deliverExports(chatId, types).catch(() => {
+    bot.sendMessage(chatId, '❌ حدث خطأ أثناء التصدير');
+  });
+}
+
+async function deliverExports(chatId, types) {
+  // قراءة كل الأنواع بالتوازي
+  // (الإرسال يبقى متسلسلًا لترتيب الرسائل)
+  const files = await Promise.all(
+    types.map(async (type) => {
+      const out = createTxtExport(`${type}.txt`);
+      await LinksRepo.eachByType(type, (row) => out.write(row.url));
+
+      const { filePath, count } = await out.end();
+      if (!count) return null;
+
+      return { type, filePath };
+    })
+  );
+
+  for (const file of files) {
+    if (!file) continue;
 
     await bot.sendDocument(
       chatId,
-      fs.createReadStream(filePath),
-      { caption: `📄 روابط ${type}` }
+      fs.createReadStream(file.filePath),
+      { caption: `📄 روابط ${file.type}` }
     );
   }
 }
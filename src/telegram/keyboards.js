@@ -1,8 +1,14 @@
 // =====================================
 // Main Control Panel Keyboard
 // =====================================
+// عنوان اللوحة — يُبنى مرة ويُعاد استخدامه
+// في كل مواضع إرسال اللوحة
+export const PANEL_TITLE = '🛠️ لوحة التحكم الرئيسية';
+
+// اللوحة ثابتة → تُسلسل JSON مرة واحدة هنا
+// (المكتبة تقبل reply_markup كنص جاهز)
 export const mainKeyboard = {
-  reply_markup: {
+  reply_markup: JSON.stringify({
     inline_keyboard: [
       [
         { text: '🔗 ربط حساب واتساب', callback_data: 'wa_link' },
@@ -27,7 +33,7 @@ export const mainKeyboard = {
         { text: '👥 الانضمام إلى مجموعات', callback_data: 'group_join' },
       ],
     ],
-  },
+  }),
 };
 
 // =====================================
@@ -1,5 +1,5 @@
 import { bot, isAdmin } from './bot.js';
-import { mainKeyboard } from './keyboards.js';
+import { mainKeyboard, PANEL_TITLE } from './keyboards.js';
 
 // Handlers
 import * as accountHandler from './handlers/account.handler.js';
@@ -14,11 +14,7 @@ import * as groupHandler from './handlers/group.handler.js';
 bot.onText(/\/start/, (msg) => {
   if (!isAdmin(msg)) return;
 
-  bot.sendMessage(
-    msg.chat.id,
-    '🛠️ لوحة التحكم الرئيسية',
-    mainKeyboard
-  );
+  bot.sendMessage(msg.chat.id, PANEL_TITLE, mainKeyboard);
 });
 
 // =====================================
@@ -60,11 +56,7 @@ bot.on('callback_query', async (query) => {
     // Navigation
     // ===============================
     if (action === 'back_main') {
-      return bot.sendMessage(
-        chatId,
-        '🛠️ لوحة التحكم الرئيسية',
-        mainKeyboard
-      );
+      return bot.sendMessage(chatId, PANEL_TITLE, mainKeyboard);
     }
 
     // ===============================
@@ -0,0 +1,38 @@
+// Set بسعة محدودة
+// عند الامتلاء يحذف الأقدم (حسب ترتيب الإدخال)
+// يمنع نمو الذاكرة بلا حدود في العمليات الطويلة
+export class BoundedSet {
+  constructor(maxSize = 5000) {
+    this.maxSize = maxSize;
+    this.items = new Set();
+  }
+
+  has(value) {
+    return this.items.has(value);
+  }
+
+  add(value) {
+    if (this.items.has(value)) return this;
+
+    if (this.items.size >= this.maxSize) {
+      // أول عنصر في Set هو الأقدم إدخالًا
+      const oldest = this.items.values().next().value;
+      this.items.delete(oldest);
+    }
+
+    this.items.add(value);
+    return this;
+  }
+
+  delete(value) {
+    return this.items.delete(value);
+  }
+
+  clear() {
+    this.items.clear();
+  }
+
+  get size() {
+    return this.items.size;
+  }
+}
@@ -1,9 +1,25 @@
-export function delay(ms) {
-  return new Promise((resolve) => setTimeout(resolve, ms));
+export function delay(ms, signal = null) {
+  return new Promise((resolve) => {
+    if (signal?.aborted) return resolve();
+
+    const onAbort = () => {
+      clearTimeout(timer);
+      resolve();
+    };
+
+    const timer = setTimeout(() => {
+      signal?.removeEventListener('abort', onAbort);
+      resolve();
+    }, ms);
+
+    // إلغاء الانتظار فورًا عند الإشارة
+    // (المستدعي يفحص حالة التشغيل بعدها)
+    signal?.addEventListener('abort', onAbort, { once: true });
+  });
 }
 
-export function randomDelay(minMs, maxMs) {
+export function randomDelay(minMs, maxMs, signal = null) {
   const ms =
     Math.floor(Math.random() * (maxMs - minMs + 1)) + minMs;
-  return delay(ms);
+  return delay(ms, signal);
 }
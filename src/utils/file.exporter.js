@@ -2,22 +2,99 @@ import fs from 'fs';
 import path from 'path';
 import { PATHS } from '../config/paths.js';
 
-export function exportTxt(filename, lines = []) {
-  const exportDir = path.join(PATHS.EXPORTS, 'links');
+const EXPORT_DIR = path.join(PATHS.EXPORTS, 'links');
 
-  if (!fs.existsSync(exportDir)) {
-    fs.mkdirSync(exportDir, { recursive: true });
-  }
+// فحص/إنشاء المجلد مرة واحدة لكل تشغيل
+// بدل syscall مع كل تصدير
+let exportDirReady = false;
 
-  const filePath = path.join(exportDir, filename);
+function ensureExportDir() {
+  if (exportDirReady) return;
+  fs.mkdirSync(EXPORT_DIR, { recursive: true });
+  exportDirReady = true;
+}
+
+// لاحقة فريدة لكل ملف مؤقت: تصديران متوازيان
+// على نفس الاسم كانا يكتبان فوق بعضهما
+let tmpSeq = 0;
+
+function tmpPathFor(filePath) {
+  tmpSeq += 1;
+  return `${filePath}.${process.pid}.${tmpSeq}.tmp`;
+}
+
+// كتابة تدفقية سطرًا بسطر مع إزالة التكرار
+// بدون بناء نص ضخم واحد في الذاكرة
+export function createTxtExport(filename) {
+  ensureExportDir();
+
+  const filePath = path.join(EXPORT_DIR, filename);
+  const tmpPath = tmpPathFor(filePath);
+
+  const stream = fs.createWriteStream(tmpPath, { encoding: 'utf8' });
+  const seen = new Set();
+  let count = 0;
+
+  // بدون مستمع error يصعد فشل fs كحدث غير معالج
+  // ويُسقط العملية كلها عبر uncaughtException
+  let streamErr = null;
+  stream.on('error', (err) => {
+    if (!streamErr) streamErr = err;
+  });
+
+  return {
+    write(line) {
+      if (!line || streamErr || seen.has(line)) return;
+      seen.add(line);
+      stream.write(`${line}\n`);
+      count += 1;
+    },
+
+    end() {
+      return new Promise((resolve, reject) => {
+        const fail = (err) => {
+          fs.unlink(tmpPath, () => {});
+          reject(err);
+        };
+
+        if (streamErr) return fail(streamErr);
+
+        // finish لا يُطلق على stream فاشل — بدون هذا
+        // يبقى المستدعي منتظرًا إلى الأبد
+        stream.on('error', fail);
+
+        stream.end(() => {
+          try {
+            if (count === 0) {
+              fs.unlinkSync(tmpPath);
+              return resolve({ filePath, count });
+            }
+
+            fs.renameSync(tmpPath, filePath);
+            resolve({ filePath, count });
+          } catch (err) {
+            reject(err);
+          }
+        });
+      });
+    },
+  };
+}
+
+export async function exportTxt(filename, lines = []) {
+  ensureExportDir();
+
+  const filePath = path.join(EXPORT_DIR, filename);
 
   const uniqueLines = [...new Set(lines)].filter(Boolean);
 
-  fs.writeFileSync(
-    filePath,
-    uniqueLines.join('\n'),
-    'utf8'
-  );
+  // كتابة ذرية: ملف مؤقت ثم rename
+  // حتى لا يبقى ملف ناقص عند أي فشل
+  // غير متزامنة حتى لا تحجب حلقة الأحداث
+  const tmpPath = tmpPathFor(filePath);
+
+  await fs.promises.writeFile(tmpPath, uniqueLines.join('\n'), 'utf8');
+  await fs.promises.rename(tmpPath, filePath);
 
   return filePath;
 }
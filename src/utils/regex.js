@@ -7,14 +7,80 @@ export const LINK_PATTERNS = {
   facebook: /facebook\.com/i,
 };
 
+// رابط دعوة مجموعة واتساب (النمط الرسمي الوحيد)
+// نمط واحد مجمّع بدل فحص متسلسل لكل مضيف
+const GROUP_INVITE_PATTERN =
+  /^https:\/\/chat\.whatsapp\.com\/[A-Za-z0-9]+$/;
+
+export function isGroupInviteLink(link) {
+  return GROUP_INVITE_PATTERN.test(link);
+}
+
+// نمط واحد مجمّع بمجموعات مسماة
+// مسح واحد للنص بدل 6 أنماط متتالية
+const COMBINED_PATTERN = new RegExp(
+  Object.entries(LINK_PATTERNS)
+    .map(([type, regex]) => `(?<${type}>${regex.source})`)
+    .join('|'),
+  'i'
+);
+
+// كاش تصنيف حسب المضيف
+// المضيفون يتكررون كثيرًا عبر الروابط المجمعة
+const hostTypeCache = new Map();
+const HOST_CACHE_MAX = 1000;
+
+function classify(url) {
+  const match = COMBINED_PATTERN.exec(url);
+  if (!match) return 'other';
+
+  for (const [type, value] of Object.entries(match.groups)) {
+    if (value !== undefined) return type;
+  }
+
+  return 'other';
+}
+
+// استخراج وتصنيف في تمريرة واحدة على النص
+// كل تطابق يرجع الرابط ونوعه معًا
+const URL_PATTERN = /https?:\/\/[^\s<>"']+/gi;
+
+export function extractLinks(text) {
+  if (!text) return [];
+
+  const found = [];
+  for (const match of text.matchAll(URL_PATTERN)) {
+    const url = match[0];
+    found.push({ url, type: detectLinkType(url) });
+  }
+
+  return found;
+}
+
 export function detectLinkType(url) {
   if (!url) return 'other';
 
-  for (const [type, regex] of Object.entries(LINK_PATTERNS)) {
-    if (regex.test(url)) {
-      return type;
-    }
+  let host = null;
+  try {
+    host = new URL(url).host.toLowerCase();
+  } catch {
+    // ليس URL كاملًا → تصنيف مباشر بدون كاش
+    return classify(url);
   }
 
-  return 'other';
+  const cached = hostTypeCache.get(host);
+  if (cached !== undefined) return cached;
+
+  // التصنيف على المضيف نفسه
+  // حتى لا يخدعنا نطاق داخل المسار
+  const type = classify(host);
+
+  // حذف الأقدم فقط (ترتيب الإدخال في Map)
+  // بدل تفريغ الكاش كاملًا عند الامتلاء
+  if (hostTypeCache.size >= HOST_CACHE_MAX) {
+    hostTypeCache.delete(hostTypeCache.keys().next().value);
+  }
+  hostTypeCache.set(host, type);
+
+  return type;
 }
@@ -1,42 +1,68 @@
-import { delay } from '../../utils/delay.js';
+import { randomDelay } from '../../utils/delay.js';
+import { AD_TYPES, TIMING } from '../../config/constants.js';
 import { RuntimeState } from '../../state/runtime.state.js';
 import { AdsRepo } from '../../database/repositories/ads.repo.js';
 import { logger } from '../../logger/logger.js';
 
+// خلط Fisher-Yates
+// (sort بمقارن عشوائي منحاز وأبطأ)
+function shuffle(items) {
+  for (let i = items.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [items[i], items[j]] = [items[j], items[i]];
+  }
+  return items;
+}
+
 export async function startAutoPosting(page) {
   const ad = await AdsRepo.getLatest();
   if (!ad) throw new Error('No ad found');
 
   RuntimeState.autoPosting = true;
-  logger.info('Auto posting started');
+  RuntimeState.autoPostingAbort = new AbortController();
+  const { signal } = RuntimeState.autoPostingAbort;
 
-  const chats = await page.$$('div[role="row"]');
+  logger.info('Auto posting started');
 
-  // ترتيب عشوائي
-  const shuffled = chats.sort(() => Math.random() - 0.5);
+  const chats = shuffle(await page.$$('div[role="row"]'));
 
-  for (const chat of shuffled) {
+  for (const chat of chats) {
     if (!RuntimeState.autoPosting) break;
 
     try {
       await chat.click();
-      await delay(2000 + Math.random() * 3000);
+      await randomDelay(
+        TIMING.MIN_ACTION_DELAY_MS,
+        TIMING.MAX_ACTION_DELAY_MS,
+        signal
+      );
+
+      // قد يصل الإيقاف أثناء الانتظار
+      if (!RuntimeState.autoPosting) break;
 
-      if (ad.type === 'text' && ad.content) {
+      if (ad.type === AD_TYPES.TEXT && ad.content) {
         await page.keyboard.type(ad.content, { delay: 40 });
         await page.keyboard.press('Enter');
       }
 
-      await delay(30000 + Math.random() * 60000); // 30–90 ثانية
+      await randomDelay(
+        TIMING.AUTO_POST_MIN_DELAY_MS,
+        TIMING.AUTO_POST_MAX_DELAY_MS,
+        signal
+      );
     } catch {
       logger.warn('Failed to post in a chat');
     }
   }
 
   RuntimeState.autoPosting = false;
+  RuntimeState.autoPostingAbort = null;
   logger.info('Auto posting finished');
 }
 
 export function stopAutoPosting() {
   RuntimeState.autoPosting = false;
+
+  // قطع الانتظار الجاري فورًا
+  RuntimeState.autoPostingAbort?.abort();
 }
@@ -1,4 +1,5 @@
 import { AutoRepliesRepo } from '../../database/repositories/autoReplies.repo.js';
+import { REPLY_SCOPES } from '../../config/constants.js';
 import { RuntimeState } from '../../state/runtime.state.js';
 import { delay } from '../../utils/delay.js';
 import { logger } from '../../logger/logger.js';
@@ -17,9 +18,12 @@ export async function handleAutoReply(page, message) {
   // منع تكرار الرد في الخاص
   if (!isGroup && RuntimeState.repliedUsers.has(senderId)) return;
 
-  const scope = isGroup ? 'group' : 'private';
+  const scope = isGroup ? REPLY_SCOPES.GROUP : REPLY_SCOPES.PRIVATE;
   const rules = await AutoRepliesRepo.getAll(scope);
 
+  // لا قواعد لهذا النطاق → خروج فوري
+  if (rules.length === 0) return;
+
   for (const rule of rules) {
     if (matchRule(text, rule)) {
       try {
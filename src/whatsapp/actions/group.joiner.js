@@ -1,21 +1,17 @@
 import { delay } from '../../utils/delay.js';
-import { db } from '../../database/db.js';
+import { JoinRequestsRepo } from '../../database/repositories/joinRequests.repo.js';
+import { JOIN_STATUS } from '../../config/constants.js';
+import { isGroupInviteLink } from '../../utils/regex.js';
 import { logger } from '../../logger/logger.js';
 
-const GROUP_LINK_REGEX = /^https:\/\/chat\.whatsapp\.com\/[A-Za-z0-9]+$/;
-
-function isValidGroupLink(link) {
-  return GROUP_LINK_REGEX.test(link);
-}
-
 export async function joinGroups(page, links = []) {
   const report = [];
 
   for (const raw of links) {
     const link = raw.trim();
 
-    if (!isValidGroupLink(link)) {
-      report.push({ link, status: 'invalid' });
+    if (!isGroupInviteLink(link)) {
+      report.push({ link, status: JOIN_STATUS.INVALID });
       continue;
     }
 
@@ -42,20 +38,28 @@ export async function joinGroups(page, links = []) {
         return 'unknown';
       });
 
-      if (status === 'requested') {
-        db.run(
-          `INSERT INTO join_requests (group_link, status)
-           VALUES (?, ?)`,
-          [link, 'pending']
-        );
-      }
-
       report.push({ link, status });
       await delay(120000); // 2 دقائق
     } catch {
-      report.push({ link, status: 'failed' });
+      report.push({ link, status: JOIN_STATUS.FAILED });
     }
   }
 
+  // تسجيل نتيجة كل رابط (وليس المعلقة فقط)
+  // حتى تبقى حالة كل محاولة قابلة للتتبع
+  try {
+    await JoinRequestsRepo.addMany(
+      report.map((r) => ({
+        link: r.link,
+        status:
+          r.status === JOIN_STATUS.REQUESTED
+            ? JOIN_STATUS.PENDING
+            : r.status,
+      }))
+    );
+  } catch {
+    logger.warn('Failed to record join results');
+  }
+
   return report;
 }
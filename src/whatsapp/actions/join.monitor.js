@@ -1,24 +1,32 @@
 import { db } from '../../database/db.js';
+import { JOIN_STATUS, TIMING } from '../../config/constants.js';
 import { logger } from '../../logger/logger.js';
 
-const DAY_MS = 24 * 60 * 60 * 1000;
+// الحد الزمني يُشتق مرة واحدة من TIMING
+// (كان يومًا مكررًا هنا بمعزل عن الإعدادات)
+const TIMEOUT_SECONDS = Math.floor(
+  TIMING.JOIN_REQUEST_TIMEOUT_MS / 1000
+);
+const CUTOFF_MODIFIER = `-${TIMEOUT_SECONDS} seconds`;
+const TIMEOUT_HOURS = TIMEOUT_SECONDS / 3600;
 
 export function checkPendingJoins() {
+  // المقارنة الزمنية داخل الاستعلام نفسه
+  // بدل تحويل تاريخ كل صف في Node
+  // الحالة حرفية في النص وليست باراميتر:
+  // الفهرس الجزئي لا يُستخدم إلا مع قيمة معروفة وقت التحضير
   db.all(
-    `SELECT * FROM join_requests WHERE status = 'pending'`,
-    [],
+    `SELECT group_link FROM join_requests
+     WHERE status = '${JOIN_STATUS.PENDING}'
+       AND requested_at <= datetime('now', ?)`,
+    [CUTOFF_MODIFIER],
     (err, rows) => {
       if (err) return;
 
-      const now = Date.now();
-
       for (const row of rows) {
-        const requestedAt = new Date(row.requested_at).getTime();
-        if (now - requestedAt >= DAY_MS) {
-          logger.warn(
-            `Join request pending >24h: ${row.group_link}`
-          );
-        }
+        logger.warn(
+          `Join request pending >${TIMEOUT_HOURS}h: ${row.group_link}`
+        );
       }
     }
   );
@@ -1,26 +1,64 @@
 import crypto from 'crypto';
 import { LinksRepo } from '../../database/repositories/links.repo.js';
 import { SettingsRepo } from '../../database/repositories/settings.repo.js';
-import { detectLinkType } from '../../utils/regex.js';
+import { detectLinkType, extractLinks } from '../../utils/regex.js';
+import { BoundedSet } from '../../utils/bounded.set.js';
 import { logger } from '../../logger/logger.js';
 
 function hashLink(url) {
   return crypto.createHash('sha256').update(url).digest('hex');
 }
 
-export async function handleMessageLinks(accountId, groupJid, links = []) {
+// مرشح أمامي للمكرر عبر الدفعات
+// الرابط المعروف لا يصل للقاعدة أصلًا
+// (أي فائت يتكفل به UNIQUE(hash))
+const seenHashes = new BoundedSet(100000);
+
+export async function handleMessageLinks(accountId, groupJid, links = [], text = '') {
   const enabled = await SettingsRepo.get('links_collecting');
   if (enabled !== '1') return;
 
-  for (const url of links) {
-    try {
-      const type = detectLinkType(url);
-      const hash = hashLink(url);
+  // روابط العناصر <a> + روابط نص الرسالة
+  // الاستخراج من النص يصنّف في نفس التمريرة
+  const candidates = links.map((url) => ({ url, type: null }));
+  if (text) {
+    candidates.push(...extractLinks(text));
+  }
+
+  // تجميع الدفعة كاملة ثم إدخال واحد
+  // (رحلة قاعدة واحدة بدل رحلة لكل رابط)
+  const rows = [];
+
+  for (const candidate of candidates) {
+    const { url } = candidate;
+    const hash = hashLink(url);
+
+    // تجاهل المكرر (داخل الدفعة وعبرها)
+    if (seenHashes.has(hash)) continue;
+    seenHashes.add(hash);
+
+    const type = candidate.type ?? detectLinkType(url);
+    rows.push({ accountId, groupJid, url, type, hash });
+  }
+
+  try {
+    await LinksRepo.addMany(rows);
+
+    // سطر ملخص واحد للدفعة كاملة
+    // بدل سجل منفصل لكل رابط
+    if (rows.length && logger.isDebugEnabled()) {
+      const byType = {};
+      for (const row of rows) {
+        byType[row.type] = (byType[row.type] || 0) + 1;
+      }
+
+      const summary = Object.entries(byType)
+        .map(([type, n]) => `${type}:${n}`)
+        .join(', ');
 
-      await LinksRepo.add(accountId, groupJid, url, type, hash);
-      logger.info(`Link collected [${type}] ${url}`);
-    } catch {
-      // رابط مكرر – يتم تجاهله
+      logger.debug(`Links collected: ${rows.length} (${summary})`);
     }
+  } catch {
+    // فشل الدفعة – المكرر تتكفل به UNIQUE(hash)
   }
 }
@@ -1,7 +1,9 @@
-import fs from 'fs';
-import path from 'path';
 import { logger } from '../../logger/logger.js';
 
+// آخر QR ملتقط محفوظ في الذاكرة
+// بدون كتابة/قراءة من القرص لكل طلب
+let lastQrBuffer = null;
+
 export async function waitForQR(page, onQR) {
   logger.info('Waiting for WhatsApp QR code');
 
@@ -15,15 +17,18 @@ export async function waitForQR(page, onQR) {
     throw new Error('QR element not found');
   }
 
-  const qrPath = path.join(process.cwd(), 'whatsapp_qr.png');
-
-  await qrElement.screenshot({ path: qrPath });
+  const qrBuffer = await qrElement.screenshot({ type: 'png' });
+  lastQrBuffer = qrBuffer;
 
   logger.info('QR code captured');
 
   if (typeof onQR === 'function') {
-    onQR(qrPath);
+    onQR(qrBuffer);
   }
 
-  return qrPath;
+  return qrBuffer;
+}
+
+export function getLastQR() {
+  return lastQrBuffer;
 }
@@ -9,9 +9,9 @@ export function getProfilePath(accountId) {
     `account_${accountId}`
   );
 
-  if (!fs.existsSync(profilePath)) {
-    fs.mkdirSync(profilePath, { recursive: true });
-  }
+  // recursive mkdir لا يفشل إن وُجد المجلد
+  // (stat + mkdir كانا زوج syscalls لكل نداء)
+  fs.mkdirSync(profilePath, { recursive: true });
 
   return profilePath;
 }
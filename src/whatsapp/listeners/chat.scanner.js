@@ -21,23 +21,49 @@ export async function scanAllChats(page, onMessage) {
         await delay(1200);
       }
 
-      const messages = await page.evaluate(() => {
-        return Array.from(
-          document.querySelectorAll('[data-testid="msg-container"]')
-        ).map((msg) => {
-          const textEl = msg.querySelector('span.selectable-text');
-          const text = textEl ? textEl.innerText : '';
-
-          const links = Array.from(msg.querySelectorAll('a'))
-            .map(a => a.href)
-            .filter(Boolean);
-
-          return { text, links };
-        });
-      });
+      // قراءة الرسائل على دفعات محدودة
+      // بدل نقل سجل المحادثة كاملًا دفعة واحدة
+      const BATCH_SIZE = 200;
+      let offset = 0;
+
+      while (true) {
+        const batch = await page.evaluate(
+          (start, limit) => {
+            // بناء النتيجة في مسار واحد
+            // بدون مصفوفات وسيطة لكل رسالة
+            const containers = document.querySelectorAll(
+              '[data-testid="msg-container"]'
+            );
+
+            const result = [];
+            const end = Math.min(start + limit, containers.length);
+
+            for (let i = start; i < end; i++) {
+              const msg = containers[i];
+
+              const textEl = msg.querySelector('span.selectable-text');
+              const text = textEl ? textEl.innerText : '';
+
+              const links = [];
+              for (const a of msg.querySelectorAll('a')) {
+                if (a.href) links.push(a.href);
+              }
+
+              result.push({ text, links });
+            }
+
+            return result;
+          },
+          offset,
+          BATCH_SIZE
+        );
+
+        for (const msg of batch) {
+          onMessage(msg);
+        }
 
-      for (const msg of messages) {
-        onMessage(msg);
+        if (batch.length < BATCH_SIZE) break;
+        offset += batch.length;
       }
     } catch (err) {
       logger.warn('Failed to scan a chat');
@@ -3,8 +3,40 @@ import { logger } from '../../logger/logger.js';
 export async function listenForNewMessages(page, onMessage) {
   logger.info('Listening for new WhatsApp messages');
 
+  // طابور محدود + مستهلك واحد متسلسل
+  // استدعاءات المتصفح قد تتداخل، والمعالجة
+  // (كتابة ردود في الصفحة) يجب ألا تتوازى
+  const MAX_QUEUE = 1000;
+  const queue = [];
+  let draining = false;
+
+  async function drain() {
+    if (draining) return;
+    draining = true;
+
+    while (queue.length) {
+      const message = queue.shift();
+      try {
+        await onMessage(message);
+      } catch {
+        logger.warn('Message handler failed');
+      }
+    }
+
+    draining = false;
+  }
+
   // تمرير callback من Node إلى المتصفح
-  await page.exposeFunction('onNewMessage', onMessage);
+  await page.exposeFunction('onNewMessage', (message) => {
+    if (queue.length >= MAX_QUEUE) {
+      // ضغط زائد → إسقاط الأقدم بدل نمو بلا حد
+      queue.shift();
+      logger.warn('Message queue full, dropping oldest');
+    }
+
+    queue.push(message);
+    drain();
+  });
 
   await page.evaluate(() => {
     const observer = new MutationObserver((mutations) => {
@@ -1,6 +1,8 @@
+import crypto from 'crypto';
 import fs from 'fs';
 import path from 'path';
-import puppeteer from 'puppeteer';
+import { launchChrome } from './browser/chrome.js';
+import { delay } from '../utils/delay.js';
 import { logger } from '../logger/logger.js';
 import { PATHS } from '../config/paths.js';
 
@@ -18,14 +20,12 @@ let currentProfilePath = null;
 // Helpers
 // ================================
 function createProfilePath() {
-  const id = `account_${Date.now()}`;
+  // لاحقة عشوائية: Date.now وحدها قد تتكرر
+  // (محاولتا ربط في نفس الميلي ثانية)
+  const id = `account_${Date.now()}_${crypto.randomUUID().slice(0, 8)}`;
   return path.join(PATHS.CHROME_DATA, 'accounts', id);
 }
 
-async function delay(ms) {
-  return new Promise(resolve => setTimeout(resolve, ms));
-}
-
 async function closeBrowser() {
   try {
     if (page) {
@@ -40,41 +40,28 @@ async function closeBrowser() {
 }
 
 async function launchBrowser(profilePath) {
-  browser = await puppeteer.launch({
-    headless: false,
-    args: [
-      '--no-sandbox',
-      '--disable-setuid-sandbox',
-      '--disable-dev-shm-usage',
-      '--disable-gpu',
-    ],
-    userDataDir: profilePath,
-  });
-
+  // مشغّل Chrome الموحد (browser/chrome.js)
+  // بدل نسخة إطلاق مكررة بإعدادات مختلفة
+  browser = await launchChrome(profilePath);
   page = await browser.newPage();
-  await page.setViewport({ width: 1280, height: 800 });
 }
 
 // ================================
 // Login Detection
 // ================================
 function watchForLogin() {
-  const interval = setInterval(async () => {
-    try {
-      const isLogged = await page.evaluate(() => {
-        return Boolean(
-          document.querySelector('[data-testid="chat-list"]')
-        );
-      });
-
-      if (isLogged) {
-        loggedIn = true;
-        qrSent = false;
-        clearInterval(interval);
-        logger.info('WhatsApp device linked successfully');
-      }
-    } catch (_) {}
-  }, 2000);
+  // انتظار حدثي عبر المتصفح نفسه
+  // بدل evaluate كل ثانيتين حتى الربط
+  page
+    .waitForSelector('[data-testid="chat-list"]', { timeout: 0 })
+    .then(() => {
+      loggedIn = true;
+      qrSent = false;
+      logger.info('WhatsApp device linked successfully');
+    })
+    .catch(() => {
+      // أُغلقت الصفحة قبل الربط
+    });
 }
 
 // ================================
@@ -111,23 +98,42 @@ export async function startWhatsAppSession(onQR, forceRestart = false) {
     // ================================
     // Detect OFFICIAL WhatsApp QR
     // ================================
-    const qrSelectors = [
+    // الدقيقة تتسابق معًا؛ العامة احتياط متسلسل فقط:
+    // صور data:image في HTML الأولي تظهر قبل canvas الـ QR
+    // فلو دخلت السباق قد نصوّر عنصرًا ليس QR
+    const specificSelectors = [
       '[data-testid="qrcode"]',
       'canvas[aria-label]',
+    ];
+    const fallbackSelectors = [
       'canvas',
       'img[src^="data:image"]',
     ];
 
     let qrElement = null;
 
-    for (const selector of qrSelectors) {
-      try {
-        qrElement = await page.waitForSelector(selector, { timeout: 15000 });
-        if (qrElement) {
-          logger.info(`QR found using selector: ${selector}`);
+    try {
+      const found = await Promise.any(
+        specificSelectors.map((selector) =>
+          page
+            .waitForSelector(selector, { timeout: 15000 })
+            .then((el) => ({ selector, el }))
+        )
+      );
+
+      qrElement = found.el;
+      logger.info(`QR found using selector: ${found.selector}`);
+    } catch (_) {
+      // ولا محدد دقيق ظهر خلال المهلة → الاحتياط
+      for (const selector of fallbackSelectors) {
+        try {
+          qrElement = await page.waitForSelector(selector, {
+            timeout: 5000,
+          });
+          logger.info(`QR found using fallback selector: ${selector}`);
           break;
-        }
-      } catch (_) {}
+        } catch (_) {}
+      }
     }
 
     if (!qrElement) {
@@ -179,6 +185,13 @@ export async function logoutWhatsApp() {
   } catch (_) {}
 }
 
+// إغلاق المتصفح فقط عند إيقاف التشغيل
+// (بدون حذف الملف الشخصي — الجلسة تبقى للتشغيل القادم)
+export async function shutdownWhatsApp() {
+  await closeBrowser();
+  logger.info('WhatsApp browser closed');
+}
+
 export async function destroyWhatsAppSession() {
   try {
     loggedIn = false;